@@ -998,7 +998,7 @@ class CommandArchitecture(object):
             's3local': 'download',
             's3': 'delete'
         }
-        result_queue = queue.Queue()
+        result_queue = queue.SimpleQueue()
         operation_name = cmd_translation[paths_type]
 
         fgen_kwargs = {
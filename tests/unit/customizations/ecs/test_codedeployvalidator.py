@@ -10,6 +10,8 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import copy
+from types import MappingProxyType
 
 from awscli.testutils import unittest
 from awscli.customizations.ecs.deploy import (CodeDeployValidator,
@@ -19,24 +21,24 @@ from awscli.customizations.ecs.exceptions import (InvalidPlatformError,
 
 
 class TestCodeDeployValidator(unittest.TestCase):
-    TEST_RESOURCES = {
+    TEST_RESOURCES = MappingProxyType({
         'service': 'test-service',
         'service_arn': 'arn:aws:ecs:::service/test-service',
         'cluster': 'test-cluster',
         'cluster_arn': 'arn:aws:ecs:::cluster/test-cluster',
         'app_name': 'test-application',
         'deployment_group_name': 'test-deployment-group'
-    }
+    })
 
-    TEST_APP_DETAILS = {
+    TEST_APP_DETAILS = MappingProxyType({
         'application': {
             'applicationId': '876uyh6-45tdfg',
             'applicationName': 'test-application',
             'computePlatform': 'ECS'
         }
-    }
+    })
 
-    TEST_DEPLOYMENT_GROUP_DETAILS = {
+    TEST_DEPLOYMENT_GROUP_DETAILS = MappingProxyType({
         'deploymentGroupInfo': {
             'applicationName': 'test-application',
             'deploymentGroupName': 'test-deployment-group',
@@ -54,13 +56,19 @@ class TestCodeDeployValidator(unittest.TestCase):
                 'clusterName': 'test-cluster'
             }]
         }
-    }
+    })
+
+    @classmethod
+    def setUpClass(cls):
+        cls._validator = CodeDeployValidator(None, cls.TEST_RESOURCES)
+        cls._validator.app_details = cls.TEST_APP_DETAILS
+        cls._validator.deployment_group_details = \
+            cls.TEST_DEPLOYMENT_GROUP_DETAILS
 
     def setUp(self):
-        self.validator = CodeDeployValidator(None, self.TEST_RESOURCES)
-        self.validator.app_details = self.TEST_APP_DETAILS
-        self.validator.deployment_group_details = \
-            self.TEST_DEPLOYMENT_GROUP_DETAILS
+        # A shallow copy keeps attribute reassignment in one test from
+        # leaking into the next while reusing the read-only fixtures.
+        self.validator = copy.copy(self._validator)
 
     def test_get_deployment_wait_time(self):
         expected_wait = 5 + 10 + TIMEOUT_BUFFER_MIN